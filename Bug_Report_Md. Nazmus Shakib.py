@@ -8,141 +8,314 @@ an Excel file (Bug_Report_Md. Nazmus Shakib.xlsx) for review or sharing.
 
 import os
 import sys
-import pandas as pd
-import datetime
+import marshal
 import textwrap
+import time
+from dataclasses import dataclass
+from pathlib import Path
 
 # Base directory setup
 if getattr(sys, "frozen", False):
-    BASE_DIR = os.path.dirname(os.path.dirname(sys.executable))
+    BASE_DIR = Path(sys.executable).resolve().parent.parent
 else:
-    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-
-SCREENSHOT_DIR = os.path.join(BASE_DIR, "screenshots")
-VIDEO_DIR = os.path.join(BASE_DIR, "videos")
-os.makedirs(SCREENSHOT_DIR, exist_ok=True)
-os.makedirs(VIDEO_DIR, exist_ok=True)
-
-# Bug data
-bugs = [
-    {
-        "BUG-ID": "BUG - 001",
-        "Title": "Page fails to load",
-        "Description": "Page fails to load after too many requests. Server returns HTTP 429",
-        "Category": "Functional",
-        "Steps to Reproduce": "1. Open page on desktop\n2.Perform multiple requests quickly\n3. Observe error",
-        "Expected Result": "Page should load without errors or server should handle high request rate gracefully.",
-        "Actual Result": "Page fails to load, shows 429 Too Many Requests.",
-        "Severity": "High",
-        "Screenshot": os.path.join(SCREENSHOT_DIR, "HTTP 429 code.JPG"),
-    },
-    {
-        "BUG-ID": "BUG - 002",
-        "Title": "Slow loading",
-        "Description": "sorbosesh news part/Sorbadhik pothito section slow loading both on desktop/mobile devices.",
-        "Category": "Performance",
-        "Steps to Reproduce": "1. Open Home page\n2. Go to the sorbosesh news part/Sorbadhik pothito section\n3. Observe slower content loading",
-        "Expected Result": "Section contents should load at the same speed like other parts",
-        "Actual Result": "Content starts slow loading making more time delay to load these sorbosesh news part/Sorbadhik pothito sections.",
-        "Severity": "Medium",
-        "Screenshot": os.path.join(SCREENSHOT_DIR, "sorbosesh news partSorbadhik pothito section.JPG"),
-    },
-    {
-        "BUG-ID": "BUG - 003",
-        "Title": "Links and Sections do not appear",
-        "Description": "Certain links and sections do not appear on mobile on first load, but becomes visible or perfectly workable after switching between desktop and mobile views. similar issues observed for multiple sections on both desktop and mobile.",
-        "Category": "Functional",
-        "Steps to Reproduce": "1. Open page on mobile view/desktop view -> some sections missing\n2. Switch views and come back again to previous views\n3. Missing links or contents are now working or available perfectly",
-        "Expected Result": "All links and content should display correctly on first load, Regardless of device or viewport changes.",
-        "Actual Result": "Some of the links and content gets disappeared because of switching viewport back and forth.",
-        "Severity": "Medium",
-        "video": os.path.join(VIDEO_DIR, "links and content disappear.mp4"),
-    },
-    {
-        "BUG-ID": "BUG - 004",
-        "Title": "Dark mode UI not appropriate",
-        "Description": "When viewing the website from chrome's dark mode, the UI colors appear mismatched - Logo, text, background, and elements look not so nice and headings of news also can’t be understood or viewed clearly as well.",
-        "Category": "UI/Design",
-        "Steps to Reproduce": "1. Open chrome\n2. Go to appearance from the chrome bottom pen icon\n3. After switching to dark mode, view the website\n4. Observe colors and texts of heading news and other parts.",
-        "Expected Result": "UI should remain visually consistent and readable in both light and dark modes.",
-        "Actual Result": "Website UI breaks in dark mode - color contrast and design look incorrect.",
-        "Severity": "Medium",
-        "video": os.path.join(VIDEO_DIR, "Website UI distorted in dark mode.mp4"),
-    },
-    {
-        "BUG-ID": "BUG - 005",
-        "Title": "Paragraph view overlaps with line separator",
-        "Description": "When viewing the home page headline news, the sub-heading paragraph view overlaps with the below separator line for desktop.",
-        "Category": "UI/Design",
-        "Steps to Reproduce": "1. Open website\n2. Wait for heading news to load\n3. See 2nd or 3rd news — the sub-heading overlaps with the bottom line.",
-        "Expected Result": "The sub-heading paragraph text should not overlap the bottom separator line.",
-        "Actual Result": "Paragraph text overlaps with the bottom separator line.",
-        "Severity": "Medium",
-        "Screenshot": os.path.join(SCREENSHOT_DIR, "subheading paragraph overlaps bottom line.JPG"),
-    },
-    {
-        "BUG-ID": "BUG - 006",
-        "Title": "Paragraph overlaps with ad banner",
-        "Description": "In desktop view, the news content text (paragraph section) overlaps with the advertisement banner placed below. The overlap causes text to be hidden and unreadable, especially in sections with more than 3 headlines.",
-        "Category": "UI/Design",
-        "Steps to Reproduce": "1. Open website\n2. Go to the 'Any news' section\n3. Browse using the next button.",
-        "Expected Result": "Paragraph text should not overlap the advertisement banner.",
-        "Actual Result": "Paragraph text overlaps with the ad banner.",
-        "Severity": "Medium",
-        "Screenshot": os.path.join(SCREENSHOT_DIR, "Rangamati news overlaps ad banner.JPG"),
-    },
-    {
-        "BUG-ID": "BUG - 007",
-        "Title": "Extra news creates blank space on left side",
-        "Description": "In desktop view, once you open 'any news' and click 'Read more', it creates an absurd blank space on the left side of the page above the footer.",
-        "Category": "UI/Design",
-        "Steps to Reproduce": "1. Open website\n2. Go to the 'Any news' section\n3. Click the 'Aro Porun / Read more' button\n4. Observe the empty left space above footer.",
-        "Expected Result": "The view should not create blank space after clicking 'Read more'.",
-        "Actual Result": "It creates a blank space on the left after clicking 'Read more'.",
-        "Severity": "Low",
-        "Screenshot": os.path.join(SCREENSHOT_DIR, "Odd UI empty section.JPG"),
-    },
-]
+    BASE_DIR = Path(__file__).resolve().parent
+
+SCREENSHOT_DIR = BASE_DIR / "screenshots"
+VIDEO_DIR = BASE_DIR / "videos"
+SCREENSHOT_DIR.mkdir(exist_ok=True)
+VIDEO_DIR.mkdir(exist_ok=True)
+
+# Exports go to the user's Desktop (USERPROFILE is the home folder on Windows)
+DESKTOP_DIR = Path(os.environ.get("USERPROFILE") or Path.home()) / "Desktop"
+
+
+# Bug data. bugs.bin is a marshal dump of bug_data.BUGS_COLUMNS written by
+# _freeze.py; loading it skips rebuilding the literal on every start.
+# bug_data.py is the source of truth, so it is used instead whenever the
+# snapshot is older than it, missing, or can't be read.
+def _load_bug_columns():
+    # The .exe carries bugs.bin inside its bundle (see the .spec datas) and
+    # bug_data compiled in, so there is no source file to compare against there
+    data_dir = Path(getattr(sys, "_MEIPASS", BASE_DIR))
+    snapshot = data_dir / "bugs.bin"
+    source = data_dir / "bug_data.py"
+    try:
+        if source.exists() and source.stat().st_mtime > snapshot.stat().st_mtime:
+            print("bugs.bin is older than bug_data.py, using bug_data.py "
+                  "(run _freeze.py to update bugs.bin)", file=sys.stderr)
+        else:
+            with open(snapshot, "rb") as fh:
+                return marshal.load(fh)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    from bug_data import BUGS_COLUMNS
+
+    return BUGS_COLUMNS
+
+
+BUGS_COLUMNS = _load_bug_columns()
+# Attachment columns hold file names; point them at the media folders
+BUGS_COLUMNS = {
+    **BUGS_COLUMNS,
+    "Screenshot": [str(SCREENSHOT_DIR / name) if name else "" for name in BUGS_COLUMNS["Screenshot"]],
+    "video": [str(VIDEO_DIR / name) if name else "" for name in BUGS_COLUMNS["video"]],
+}
+
+# Excel column order
+COLUMNS = list(BUGS_COLUMNS)
+
+
+@dataclass(frozen=True, slots=True)
+class Bug:
+    bug_id: str
+    title: str
+    description: str
+    category: str
+    steps: str
+    expected: str
+    actual: str
+    severity: str
+    screenshot: str = ""
+    video: str = ""
+
+
+# Bug field for each column, so rows map by name whatever the column order
+_FIELD_OF = {
+    "BUG-ID": "bug_id",
+    "Title": "title",
+    "Description": "description",
+    "Category": "category",
+    "Steps to Reproduce": "steps",
+    "Expected Result": "expected",
+    "Actual Result": "actual",
+    "Severity": "severity",
+    "Screenshot": "screenshot",
+    "video": "video",
+}
+
+# Row view of the same data, one Bug per bug, for printing
+BUGS = tuple(
+    Bug(**{_FIELD_OF[col]: value for col, value in zip(BUGS_COLUMNS, row)})
+    for row in zip(*BUGS_COLUMNS.values())
+)
 
 # ---------- Display Function ----------
 
+# Label prefixes never change, so build them once. Wrapped fields use one
+# space less after the colon than single-line fields.
+_LABELS = {
+    "BUG-ID": f"{'BUG ID':<20} :   ",
+    "Title": f"{'Title':<20} :   ",
+    "Description": f"{'Description':<20} :  ",
+    "Category": f"{'Category':<20} :   ",
+    "Steps to Reproduce": f"{'Steps to Reproduce':<20} :  ",
+    "Expected Result": f"{'Expected Result':<20} :  ",
+    "Actual Result": f"{'Actual Result':<20} :  ",
+    "Severity": f"{'Severity':<20} :   ",
+    "Screenshot": f"{'Screenshot':<20} :   ",
+    "video": f"{'video':<20} :   ",
+}
+_SEPARATOR = "-" * 60
+_WRAPPER = textwrap.TextWrapper(width=90, subsequent_indent=" " * 25)
+
+# The bug data is fixed, so the multi-line fields are wrapped once here
+# and display_bug only looks the result up
+_WRAPPED_FIELDS = ("Description", "Steps to Reproduce", "Expected Result", "Actual Result")
+_WRAPPED = {
+    (i, field): _WRAPPER.fill(getattr(bug, _FIELD_OF[field]))
+    for i, bug in enumerate(BUGS)
+    for field in _WRAPPED_FIELDS
+}
+
+
 def display_bug():
-    def indent_multiline(label, text, width=90, pad=20):
-        
-        wrapper = textwrap.TextWrapper(width=width,
-        subsequent_indent=" " * (pad + 5))
-        wrapped = wrapper.fill(str(text))
-        return f"{label:<{pad}} :  {wrapped}"
-
-    print("\n=== BUG REPORT SUMMARY ===\n")
-
-    for bug in bugs:
-        print(f"{'BUG ID':<20} :   {bug.get('BUG-ID')}")
-        print(f"{'Title':<20} :   {bug.get('Title')}")
-        print(indent_multiline("Description", bug.get("Description", "")))
-        print(f"{'Category':<20} :   {bug.get('Category')}")
-        print(indent_multiline("Steps to Reproduce", bug.get("Steps to Reproduce", "")))
-        print(indent_multiline("Expected Result", bug.get("Expected Result", "")))
-        print(indent_multiline("Actual Result", bug.get("Actual Result", "")))
-        print(f"{'Severity':<20} :   {bug.get('Severity')}")
-        if bug.get("Screenshot"):
-            print(f"{'Screenshot':<20} :   {bug.get('Screenshot')}")
-        if bug.get("video"):
-            print(f"{'video':<20} :   {bug.get('video')}")
-        print("-" * 60)
+    # Collect every line and write the report out in one go
+    parts = ["\n=== BUG REPORT SUMMARY ===\n"]
+
+    for i, bug in enumerate(BUGS):
+        parts.append(_LABELS["BUG-ID"] + bug.bug_id)
+        parts.append(_LABELS["Title"] + bug.title)
+        parts.append(_LABELS["Description"] + _WRAPPED[i, "Description"])
+        parts.append(_LABELS["Category"] + bug.category)
+        parts.append(_LABELS["Steps to Reproduce"] + _WRAPPED[i, "Steps to Reproduce"])
+        parts.append(_LABELS["Expected Result"] + _WRAPPED[i, "Expected Result"])
+        parts.append(_LABELS["Actual Result"] + _WRAPPED[i, "Actual Result"])
+        parts.append(_LABELS["Severity"] + bug.severity)
+        if screenshot := bug.screenshot:
+            parts.append(_LABELS["Screenshot"] + screenshot)
+        if video := bug.video:
+            parts.append(_LABELS["video"] + video)
+        parts.append(_SEPARATOR)
+
+    sys.stdout.write("\n".join(parts) + "\n")
 
 
 # ---------- Excel Export ----------
-def export_to_excel():
-    df = pd.DataFrame(bugs)
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    desktop_dir = os.path.join(os.path.expanduser("~"), "Desktop")
-    output_file = os.path.join(desktop_dir, f"Bug_Report_Md_Nazmus_Shakib_{timestamp}.xlsx")
-    df.to_excel(output_file, index=False)
-    print(f"\nExcel file created successfully!'{output_file}'")
+# An .xlsx file is just a zip of XML parts. Everything except the sheet
+# itself is fixed, so the parts are kept here and written as-is.
+_NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_NS_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_NS_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+_XML_DECL = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+_XLSX_PARTS = {
+    "[Content_Types].xml": (
+        _XML_DECL
+        + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        _XML_DECL
+        + f'<Relationships xmlns="{_NS_PKG_REL}">'
+        f'<Relationship Id="rId1" Type="{_NS_REL}/officeDocument" Target="xl/workbook.xml"/>'
+        "</Relationships>"
+    ),
+    "xl/workbook.xml": (
+        _XML_DECL
+        + f'<workbook xmlns="{_NS_MAIN}" xmlns:r="{_NS_REL}">'
+        '<sheets><sheet name="Bugs" sheetId="1" r:id="rId1"/></sheets>'
+        "</workbook>"
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        _XML_DECL
+        + f'<Relationships xmlns="{_NS_PKG_REL}">'
+        f'<Relationship Id="rId1" Type="{_NS_REL}/worksheet" Target="worksheets/sheet1.xml"/>'
+        f'<Relationship Id="rId2" Type="{_NS_REL}/styles" Target="styles.xml"/>'
+        "</Relationships>"
+    ),
+    "xl/styles.xml": (
+        _XML_DECL
+        + f'<styleSheet xmlns="{_NS_MAIN}">'
+        '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        "</styleSheet>"
+    ),
+}
+
+
+# Buffer size for the output file
+_WRITE_BUFFER = 1 << 20
+
+# Sheet rows are rendered this many at a time, and in worker processes
+# once the report has more than _PARALLEL_THRESHOLD rows
+_CHUNK_ROWS = 1000
+_PARALLEL_THRESHOLD = 5000
+
+
+def _column_letter(index):
+    # 0 -> "A", 25 -> "Z", 26 -> "AA"
+    letters = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def _render_rows(start, rows):
+    # Sheet XML for rows numbered from start. Kept at module level so worker
+    # processes can run it.
+    from xml.sax.saxutils import escape
+
+    letters = [_column_letter(i) for i in range(len(COLUMNS))]
+    out = []
+    for r, row in enumerate(rows, start):
+        cells = "".join(
+            f'<c r="{letter}{r}" t="inlineStr"><is>'
+            f'<t xml:space="preserve">{escape(str(value))}</t></is></c>'
+            for letter, value in zip(letters, row)
+            if value
+        )
+        out.append(f'<row r="{r}">{cells}</row>')
+    return "".join(out)
+
+
+def _write_sheet(zf, rows):
+    # Rows are rendered in chunks and streamed into the zip entry, so the
+    # sheet XML is never held in memory as a whole. Big reports render the
+    # chunks in worker processes, with at most one chunk per CPU queued
+    # ahead of the writer, and written back in row order.
+    import collections
+    import io
+    import zipfile
+
+    starts = range(1, len(rows) + 1, _CHUNK_ROWS)
+    chunks = (rows[i - 1:i - 1 + _CHUNK_ROWS] for i in starts)
+    # An explicit ZipInfo so the entry gets the current time like the
+    # writestr() parts, rather than ZipInfo's 1980 default
+    info = zipfile.ZipInfo("xl/worksheets/sheet1.xml", time.localtime()[:6])
+    info.compress_type = zipfile.ZIP_DEFLATED
+    raw = zf.open(info, "w")
+    with io.TextIOWrapper(raw, encoding="utf-8") as out:
+        out.write(_XML_DECL)
+        out.write(f'<worksheet xmlns="{_NS_MAIN}"><sheetData>')
+        if len(rows) > _PARALLEL_THRESHOLD:
+            from concurrent.futures import ProcessPoolExecutor
+
+            ahead = os.cpu_count() or 1
+            pending = collections.deque()
+            with ProcessPoolExecutor() as ex:
+                for start, chunk in zip(starts, chunks):
+                    pending.append(ex.submit(_render_rows, start, chunk))
+                    if len(pending) > ahead:
+                        out.write(pending.popleft().result())
+                while pending:
+                    out.write(pending.popleft().result())
+        else:
+            for xml in map(_render_rows, starts, chunks):
+                out.write(xml)
+        out.write("</sheetData></worksheet>")
+
+
+def export_to_excel(output_format="xlsx"):
+    # output_format="csv" writes a plain CSV instead. It is much cheaper to
+    # produce than xlsx (just joined text per row, no zip/XML), so use it
+    # when the report only needs to be reviewed as a table.
+    rows = [COLUMNS]
+    rows.extend(zip(*BUGS_COLUMNS.values()))
+
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    output_file = DESKTOP_DIR / f"Bug_Report_Md_Nazmus_Shakib_{timestamp}.xlsx"
+    if output_format == "xlsx":
+        # Imported here so printing the report doesn't pay for the export modules
+        import zipfile
+
+        # One large buffer so the file goes out in a few big writes
+        with open(output_file, "wb", buffering=_WRITE_BUFFER) as fh:
+            with zipfile.ZipFile(fh, "w", zipfile.ZIP_DEFLATED) as zf:
+                for name, data in _XLSX_PARTS.items():
+                    zf.writestr(name, data)
+                _write_sheet(zf, rows)
+        print(f"\nExcel file created successfully!'{output_file}'")
+    elif output_format == "csv":
+        import csv
+
+        output_file = output_file.with_suffix(".csv")
+        # utf-8-sig so Excel detects the encoding when opening the file
+        with open(output_file, "w", buffering=_WRITE_BUFFER, newline="",
+                  encoding="utf-8-sig") as fh:
+            csv.writer(fh).writerows(rows)
+        print(f"\nCSV file created successfully!'{output_file}'")
+    else:
+        raise ValueError(f"Unknown output format: {output_format!r}")
 
 # ---------- Main ----------
 if __name__ == "__main__":
+    if getattr(sys, "frozen", False):
+        # Needed for the export worker processes in the PyInstaller .exe
+        import multiprocessing
+
+        multiprocessing.freeze_support()
     display_bug()
     export_to_excel()
     input("\nPress Enter to exit....")
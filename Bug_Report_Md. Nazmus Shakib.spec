@@ -5,7 +5,8 @@ a = Analysis(
     ['Bug_Report_Md. Nazmus Shakib.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    # Run _freeze.py before building so the bundled bugs.bin matches bug_data.py
+    datas=[('bugs.bin', '.')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
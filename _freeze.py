@@ -0,0 +1,15 @@
+"""
+Writes bugs.bin, a marshal dump of the bug data in bug_data.py.
+Run it again whenever bug_data.py changes:  python _freeze.py
+"""
+
+import marshal
+from pathlib import Path
+
+from bug_data import BUGS_COLUMNS
+
+if __name__ == "__main__":
+    output_file = Path(__file__).resolve().parent / "bugs.bin"
+    with open(output_file, "wb") as fh:
+        marshal.dump(BUGS_COLUMNS, fh)
+    print(f"Wrote {output_file}")
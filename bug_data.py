@@ -0,0 +1,112 @@
+"""
+Bug data for the bug report script.
+This is the readable source of truth. After editing it, run _freeze.py to
+regenerate bugs.bin, which the report script loads at startup.
+"""
+
+import sys
+
+# Category and severity values repeat across bugs; intern them so every
+# row shares one string object (and its cached hash)
+CAT_FUNCTIONAL = sys.intern("Functional")
+CAT_PERFORMANCE = sys.intern("Performance")
+CAT_UI_DESIGN = sys.intern("UI/Design")
+SEV_HIGH = sys.intern("High")
+SEV_MEDIUM = sys.intern("Medium")
+SEV_LOW = sys.intern("Low")
+
+# Bug data, stored column by column (one list per Excel column).
+# Screenshot/video entries are file names inside the screenshots/ and
+# videos/ folders.
+BUGS_COLUMNS = {
+    "BUG-ID": [
+        "BUG - 001",
+        "BUG - 002",
+        "BUG - 003",
+        "BUG - 004",
+        "BUG - 005",
+        "BUG - 006",
+        "BUG - 007",
+    ],
+    "Title": [
+        "Page fails to load",
+        "Slow loading",
+        "Links and Sections do not appear",
+        "Dark mode UI not appropriate",
+        "Paragraph view overlaps with line separator",
+        "Paragraph overlaps with ad banner",
+        "Extra news creates blank space on left side",
+    ],
+    "Description": [
+        "Page fails to load after too many requests. Server returns HTTP 429",
+        "sorbosesh news part/Sorbadhik pothito section slow loading both on desktop/mobile devices.",
+        "Certain links and sections do not appear on mobile on first load, but becomes visible or perfectly workable after switching between desktop and mobile views. similar issues observed for multiple sections on both desktop and mobile.",
+        "When viewing the website from chrome's dark mode, the UI colors appear mismatched - Logo, text, background, and elements look not so nice and headings of news also can’t be understood or viewed clearly as well.",
+        "When viewing the home page headline news, the sub-heading paragraph view overlaps with the below separator line for desktop.",
+        "In desktop view, the news content text (paragraph section) overlaps with the advertisement banner placed below. The overlap causes text to be hidden and unreadable, especially in sections with more than 3 headlines.",
+        "In desktop view, once you open 'any news' and click 'Read more', it creates an absurd blank space on the left side of the page above the footer.",
+    ],
+    "Category": [
+        CAT_FUNCTIONAL,
+        CAT_PERFORMANCE,
+        CAT_FUNCTIONAL,
+        CAT_UI_DESIGN,
+        CAT_UI_DESIGN,
+        CAT_UI_DESIGN,
+        CAT_UI_DESIGN,
+    ],
+    "Steps to Reproduce": [
+        "1. Open page on desktop\n2.Perform multiple requests quickly\n3. Observe error",
+        "1. Open Home page\n2. Go to the sorbosesh news part/Sorbadhik pothito section\n3. Observe slower content loading",
+        "1. Open page on mobile view/desktop view -> some sections missing\n2. Switch views and come back again to previous views\n3. Missing links or contents are now working or available perfectly",
+        "1. Open chrome\n2. Go to appearance from the chrome bottom pen icon\n3. After switching to dark mode, view the website\n4. Observe colors and texts of heading news and other parts.",
+        "1. Open website\n2. Wait for heading news to load\n3. See 2nd or 3rd news — the sub-heading overlaps with the bottom line.",
+        "1. Open website\n2. Go to the 'Any news' section\n3. Browse using the next button.",
+        "1. Open website\n2. Go to the 'Any news' section\n3. Click the 'Aro Porun / Read more' button\n4. Observe the empty left space above footer.",
+    ],
+    "Expected Result": [
+        "Page should load without errors or server should handle high request rate gracefully.",
+        "Section contents should load at the same speed like other parts",
+        "All links and content should display correctly on first load, Regardless of device or viewport changes.",
+        "UI should remain visually consistent and readable in both light and dark modes.",
+        "The sub-heading paragraph text should not overlap the bottom separator line.",
+        "Paragraph text should not overlap the advertisement banner.",
+        "The view should not create blank space after clicking 'Read more'.",
+    ],
+    "Actual Result": [
+        "Page fails to load, shows 429 Too Many Requests.",
+        "Content starts slow loading making more time delay to load these sorbosesh news part/Sorbadhik pothito sections.",
+        "Some of the links and content gets disappeared because of switching viewport back and forth.",
+        "Website UI breaks in dark mode - color contrast and design look incorrect.",
+        "Paragraph text overlaps with the bottom separator line.",
+        "Paragraph text overlaps with the ad banner.",
+        "It creates a blank space on the left after clicking 'Read more'.",
+    ],
+    "Severity": [
+        SEV_HIGH,
+        SEV_MEDIUM,
+        SEV_MEDIUM,
+        SEV_MEDIUM,
+        SEV_MEDIUM,
+        SEV_MEDIUM,
+        SEV_LOW,
+    ],
+    "Screenshot": [
+        "HTTP 429 code.JPG",
+        "sorbosesh news partSorbadhik pothito section.JPG",
+        "",
+        "",
+        "subheading paragraph overlaps bottom line.JPG",
+        "Rangamati news overlaps ad banner.JPG",
+        "Odd UI empty section.JPG",
+    ],
+    "video": [
+        "",
+        "",
+        "links and content disappear.mp4",
+        "Website UI distorted in dark mode.mp4",
+        "",
+        "",
+        "",
+    ],
+}